@@ -1,5 +1,7 @@
+import hashlib
 import os
-from datetime import datetime
+import threading
+import time
 from functools import wraps
 
 from flask import (
@@ -10,8 +12,13 @@ from flask import (
     request,
     flash,
     abort,
+    g,
 )
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.record_queries import get_recorded_queries
+from sqlalchemy import func, make_url, select
+from sqlalchemy.orm import contains_eager, joinedload, raiseload, selectinload, validates
 from flask_login import (
     LoginManager,
     login_user,
@@ -19,8 +26,13 @@ from flask_login import (
     logout_user,
     current_user,
     UserMixin,
+    AnonymousUserMixin,
 )
-from werkzeug.security import generate_password_hash, check_password_hash
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
+from cachetools import TTLCache
 
 # --------------------------------------------------
 # App and database setup
@@ -28,6 +40,10 @@ from werkzeug.security import generate_password_hash, check_password_hash
 
 app = Flask(__name__)
 
+# Share compiled templates between worker processes and restarts
+# (defaults to a per-user directory under the system temp dir)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(os.environ.get("JINJA_CACHE_DIR"))
+
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "change-this-secret")
 
 # Use Postgres if DATABASE_URL is set, otherwise fall back to local SQLite
@@ -38,12 +54,61 @@ if db_url and db_url.startswith("postgres://"):
 
 app.config["SQLALCHEMY_DATABASE_URI"] = db_url or "sqlite:///ascend_internal.db"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# Count queries per request in development (FLASK_DEBUG=1 or `python app.py`) to catch N+1 regressions
+app.config["SQLALCHEMY_RECORD_QUERIES"] = app.debug or __name__ == "__main__"
+
+# Remember recent password verifications for a minute to absorb bursts of re-logins
+app.config["USE_VERIFY_PASSWORD_CACHE"] = os.environ.get("USE_VERIFY_PASSWORD_CACHE") == "1"
+
+if db_url and make_url(db_url).get_backend_name() == "postgresql":
+    # Keep a warm pool of Postgres connections and drop dead ones before use
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_size": 10,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_use_lifo": True,
+    }
+
+if db_url and make_url(db_url).get_driver_name() == "psycopg2":
+    # Send multi-row INSERT/UPDATE through psycopg2's fast execution helpers
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"].update(
+        {
+            "executemany_mode": "values_plus_batch",
+            "insertmanyvalues_page_size": 1000,
+            "executemany_batch_page_size": 500,
+        }
+    )
 
 db = SQLAlchemy(app)
 
+# Dropdown options are only cached when a shared backend is configured
+# (CACHE_TYPE=RedisCache and CACHE_REDIS_URL). SimpleCache is per process, so with
+# more than one gunicorn worker delete_memoized only clears the worker that handled
+# the write and the others serve stale options until the timeout; don't use it there.
+app.config["CACHE_TYPE"] = os.environ.get("CACHE_TYPE", "NullCache")
+app.config["CACHE_REDIS_URL"] = os.environ.get("CACHE_REDIS_URL")
+app.config["CACHE_NO_NULL_WARNING"] = True
+cache = Cache(app)
+
 login_manager = LoginManager(app)
 login_manager.login_view = "login"
 
+# Argon2id defaults to OWASP's 46 MiB / 1 pass; run `flask tune-argon2` on the
+# production host to pick a larger ARGON2_MEMORY_COST, then pin it in the environment
+app.config["ARGON2_TIME_COST"] = int(os.environ.get("ARGON2_TIME_COST", 1))
+app.config["ARGON2_MEMORY_COST"] = int(os.environ.get("ARGON2_MEMORY_COST", 46 * 1024))
+
+ph = PasswordHasher(
+    time_cost=app.config["ARGON2_TIME_COST"],
+    memory_cost=app.config["ARGON2_MEMORY_COST"],
+    parallelism=1,
+)
+
+# (user id, stored hash, sha256 of submitted password) -> verification result
+_verify_cache = TTLCache(maxsize=4096, ttl=60)
+_verify_cache_lock = threading.Lock()  # TTLCache is not thread-safe under gthread workers
+
 
 # --------------------------------------------------
 # Models
@@ -59,11 +124,49 @@ class User(UserMixin, db.Model):
     role = db.Column(db.String(20), nullable=False, default="freelancer")  # "founder" or "freelancer"
     active = db.Column(db.Boolean, default=True)
 
+    # Logins look users up by lower(email), and this keeps mixed-case duplicates out
+    __table_args__ = (
+        db.Index("ix_users_email_lower", func.lower(email), unique=True),
+    )
+
+    @validates("email")
+    def normalize_email(self, key, email):
+        return email.strip().lower()
+
     def set_password(self, password: str) -> None:
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = ph.hash(password)
 
     def check_password(self, password: str) -> bool:
-        return check_password_hash(self.password_hash, password)
+        if not app.config["USE_VERIFY_PASSWORD_CACHE"]:
+            return self._verify_password(password)
+
+        # The stored hash is part of the key, so changing the password invalidates it
+        digest = hashlib.sha256(password.encode("utf-8")).digest()
+        with _verify_cache_lock:
+            result = _verify_cache.get((self.id, self.password_hash, digest))
+        if result is None:
+            # Verify outside the lock so concurrent logins hash in parallel
+            result = self._verify_password(password)
+            with _verify_cache_lock:
+                _verify_cache[(self.id, self.password_hash, digest)] = result
+        return result
+
+    def _verify_password(self, password: str) -> bool:
+        # Legacy werkzeug hashes: verify once, then upgrade to argon2
+        if self.password_hash.startswith(("pbkdf2:", "scrypt:")):
+            if not check_password_hash(self.password_hash, password):
+                return False
+            self.set_password(password)
+            return True
+
+        try:
+            ph.verify(self.password_hash, password)
+        except (VerifyMismatchError, InvalidHashError):
+            return False
+
+        if ph.check_needs_rehash(self.password_hash):
+            self.set_password(password)
+        return True
 
     def get_id(self):
         return str(self.id)
@@ -74,11 +177,11 @@ class Event(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(200), nullable=False)
-    date_start = db.Column(db.Date, nullable=False)
+    date_start = db.Column(db.Date, nullable=False, index=True)
     date_end = db.Column(db.Date, nullable=False)
     location = db.Column(db.String(200), nullable=True)
 
-    sessions = db.relationship("Session", backref="event", lazy=True)
+    sessions = db.relationship("Session", back_populates="event")
 
 
 class Session(db.Model):
@@ -87,11 +190,12 @@ class Session(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey("events.id"), nullable=False)
     label = db.Column(db.String(100), nullable=False)  # e.g., "Day 1 AM"
-    date = db.Column(db.Date, nullable=False)
+    date = db.Column(db.Date, nullable=False, index=True)
     time_block = db.Column(db.String(20), nullable=True)  # "AM" or "PM"
 
-    athlete_sessions = db.relationship("AthleteSession", backref="session", lazy=True)
-    manpower_allocations = db.relationship("ManpowerAllocation", backref="session", lazy=True)
+    event = db.relationship("Event", back_populates="sessions")
+    athlete_sessions = db.relationship("AthleteSession", back_populates="session")
+    manpower_allocations = db.relationship("ManpowerAllocation", back_populates="session")
 
 
 class Package(db.Model):
@@ -111,7 +215,7 @@ class Athlete(db.Model):
     weight_class = db.Column(db.String(50), nullable=True)
     notes = db.Column(db.String(255), nullable=True)
 
-    athlete_sessions = db.relationship("AthleteSession", backref="athlete", lazy=True)
+    athlete_sessions = db.relationship("AthleteSession", back_populates="athlete")
 
 
 class AthleteSession(db.Model):
@@ -119,7 +223,7 @@ class AthleteSession(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     athlete_id = db.Column(db.Integer, db.ForeignKey("athletes.id"), nullable=False)
-    session_id = db.Column(db.Integer, db.ForeignKey("sessions.id"), nullable=False)
+    session_id = db.Column(db.Integer, db.ForeignKey("sessions.id"), nullable=False, index=True)
     package_id = db.Column(db.Integer, db.ForeignKey("packages.id"), nullable=False)
 
     music_link = db.Column(db.String(255), nullable=True)
@@ -128,6 +232,8 @@ class AthleteSession(db.Model):
     paid = db.Column(db.Boolean, default=False)
     notes = db.Column(db.String(255), nullable=True)
 
+    athlete = db.relationship("Athlete", back_populates="athlete_sessions")
+    session = db.relationship("Session", back_populates="athlete_sessions")
     package = db.relationship("Package")
 
 
@@ -137,9 +243,9 @@ class SdCard(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     label = db.Column(db.String(50), nullable=False, unique=True)
     capacity_gb = db.Column(db.Integer, nullable=True)
-    status = db.Column(db.String(20), nullable=False, default="available")  # available, checked_out, lost
+    status = db.Column(db.String(20), nullable=False, default="available", index=True)  # available, checked_out, lost
 
-    logs = db.relationship("SdCardLog", backref="sd_card", lazy=True)
+    logs = db.relationship("SdCardLog", back_populates="sd_card")
 
 
 class SdCardLog(db.Model):
@@ -152,9 +258,20 @@ class SdCardLog(db.Model):
     session_id = db.Column(db.Integer, db.ForeignKey("sessions.id"), nullable=True)
 
     purpose = db.Column(db.String(255), nullable=True)
-    checked_out_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    checked_out_at = db.Column(db.DateTime, nullable=False, default=func.now(), server_default=func.now())
     returned_at = db.Column(db.DateTime, nullable=True)
 
+    # Only cards still out are looked up by returned_at
+    __table_args__ = (
+        db.Index(
+            "ix_sd_card_logs_open",
+            returned_at,
+            postgresql_where=returned_at.is_(None),
+            sqlite_where=returned_at.is_(None),
+        ),
+    )
+
+    sd_card = db.relationship("SdCard", back_populates="logs")
     user = db.relationship("User")
     event = db.relationship("Event")
     session = db.relationship("Session")
@@ -172,6 +289,7 @@ class ManpowerAllocation(db.Model):
     notes = db.Column(db.String(255), nullable=True)
 
     event = db.relationship("Event")
+    session = db.relationship("Session", back_populates="manpower_allocations")
     user = db.relationship("User")
 
 
@@ -183,9 +301,21 @@ class EditTask(db.Model):
     assigned_to_user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
 
     type = db.Column(db.String(50), nullable=False)  # photos, highlight, static_video
-    status = db.Column(db.String(50), nullable=False, default="not_started")
+    status = db.Column(db.String(50), nullable=False, default="not_started", index=True)
     deliverable_link = db.Column(db.String(255), nullable=True)
-    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, nullable=False, default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
+
+    # Dashboard counts tasks that have not been delivered yet
+    __table_args__ = (
+        db.Index(
+            "ix_edit_tasks_pending",
+            status,
+            postgresql_where=status != "sent_to_client",
+            sqlite_where=status != "sent_to_client",
+        ),
+    )
 
     athlete_session = db.relationship("AthleteSession")
     assigned_to = db.relationship("User")
@@ -195,9 +325,27 @@ class EditTask(db.Model):
 # Login manager
 # --------------------------------------------------
 
+class AnonymousUser(AnonymousUserMixin):
+    # Lets role checks on anonymous requests short-circuit without a lookup
+    role = None
+
+
+login_manager.anonymous_user = AnonymousUser
+
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    # Flask-Login calls this at most once per request and keeps the result on g._login_user
+    user = db.session.get(User, int(user_id))
+    g.user_role = user.role if user else None
+    return user
+
+
+@app.after_request
+def log_query_count(response):
+    if app.config["SQLALCHEMY_RECORD_QUERIES"]:
+        app.logger.debug("%s issued %d queries", request.endpoint, len(get_recorded_queries()))
+    return response
 
 
 # --------------------------------------------------
@@ -207,12 +355,47 @@ def load_user(user_id):
 def founder_required(view_func):
     @wraps(view_func)
     def wrapper(*args, **kwargs):
-        if not current_user.is_authenticated or current_user.role != "founder":
+        # login_required has already resolved current_user, which stashes the role on g
+        if g.get("user_role") != "founder":
             abort(403)
         return view_func(*args, **kwargs)
     return wrapper
 
 
+# --------------------------------------------------
+# Cached dropdown options
+# --------------------------------------------------
+
+# These back the <select> lists on most pages and rarely change, so they are
+# column-only queries returned as plain dicts, cached when a shared backend is
+# configured and invalidated from the admin views that edit them.
+
+@cache.memoize(timeout=300)
+def event_options():
+    rows = db.session.execute(select(Event.id, Event.name).order_by(Event.date_start.desc()))
+    return [row._asdict() for row in rows]
+
+
+@cache.memoize(timeout=300)
+def session_options():
+    rows = db.session.execute(select(Session.id, Session.label, Session.date).order_by(Session.date.asc()))
+    return [row._asdict() for row in rows]
+
+
+@cache.memoize(timeout=300)
+def package_options():
+    rows = db.session.execute(select(Package.id, Package.name).order_by(Package.name.asc()))
+    return [row._asdict() for row in rows]
+
+
+@cache.memoize(timeout=300)
+def active_user_options():
+    rows = db.session.execute(
+        select(User.id, User.name, User.role).where(User.active.is_(True)).order_by(User.name.asc())
+    )
+    return [row._asdict() for row in rows]
+
+
 # --------------------------------------------------
 # Routes: auth
 # --------------------------------------------------
@@ -226,8 +409,10 @@ def login():
         email = request.form.get("email", "").strip().lower()
         password = request.form.get("password", "")
 
-        user = User.query.filter_by(email=email, active=True).first()
+        user = User.query.filter(func.lower(User.email) == email, User.active.is_(True)).first()
         if user and user.check_password(password):
+            # check_password may have upgraded the stored hash
+            db.session.commit()
             login_user(user)
             return redirect(url_for("dashboard"))
         flash("Invalid email or password", "danger")
@@ -246,13 +431,36 @@ def logout():
 # Routes: dashboard
 # --------------------------------------------------
 
+DASHBOARD_COUNTS_TTL = 5  # seconds
+
+_dashboard_counts_cache = {"expires": 0.0, "counts": None}
+
+
+# One round-trip for all dashboard counters, reused for DASHBOARD_COUNTS_TTL seconds to
+# absorb bursts; writes that change the counts reset it (in this worker) straight away
+def dashboard_counts():
+    now = time.monotonic()
+    if _dashboard_counts_cache["counts"] is not None and now < _dashboard_counts_cache["expires"]:
+        return _dashboard_counts_cache["counts"]
+
+    row = db.session.execute(
+        select(
+            select(func.count(SdCard.id)).scalar_subquery(),
+            select(func.count(SdCard.id)).where(SdCard.status == "checked_out").scalar_subquery(),
+            select(func.count(EditTask.id)).where(EditTask.status != "sent_to_client").scalar_subquery(),
+        )
+    ).one()
+    counts = tuple(row)
+    _dashboard_counts_cache["counts"] = counts
+    _dashboard_counts_cache["expires"] = now + DASHBOARD_COUNTS_TTL
+    return counts
+
+
 @app.route("/")
 @login_required
 def dashboard():
     events = Event.query.order_by(Event.date_start.desc()).all()
-    total_sd_cards = SdCard.query.count()
-    sd_in_use = SdCard.query.filter_by(status="checked_out").count()
-    pending_edits = EditTask.query.filter(EditTask.status != "sent_to_client").count()
+    total_sd_cards, sd_in_use, pending_edits = dashboard_counts()
     return render_template(
         "dashboard.html",
         events=events,
@@ -280,18 +488,24 @@ def sd_cards_view():
                 card = SdCard(label=label, capacity_gb=int(capacity_gb) if capacity_gb else None)
                 db.session.add(card)
                 db.session.commit()
+                _dashboard_counts_cache["expires"] = 0.0
                 flash("SD card added", "success")
             else:
                 flash("Label is required", "danger")
 
         elif action == "checkout":
-            sd_card_id = request.form.get("sd_card_id")
+            sd_card_id = request.form.get("sd_card_id", type=int)
             event_id = request.form.get("event_id") or None
             session_id = request.form.get("session_id") or None
             purpose = request.form.get("purpose", "")
 
-            card = SdCard.query.get(sd_card_id)
-            if card and card.status == "available":
+            # Lock the row so two people can't check out the same card at once
+            card = db.session.execute(
+                select(SdCard)
+                .where(SdCard.id == sd_card_id, SdCard.status == "available")
+                .with_for_update()
+            ).scalar_one_or_none()
+            if card:
                 log = SdCardLog(
                     sd_card_id=card.id,
                     user_id=current_user.id,
@@ -302,29 +516,37 @@ def sd_cards_view():
                 card.status = "checked_out"
                 db.session.add(log)
                 db.session.commit()
+                _dashboard_counts_cache["expires"] = 0.0
                 flash("SD card checked out", "success")
             else:
                 flash("Card not available", "danger")
 
         elif action == "return":
-            log_id = request.form.get("log_id")
-            log = SdCardLog.query.get(log_id)
+            log_id = request.form.get("log_id", type=int)
+            log = db.session.get(SdCardLog, log_id, options=[joinedload(SdCardLog.sd_card)])
             if log and log.returned_at is None:
-                log.returned_at = datetime.utcnow()
+                log.returned_at = func.now()
                 card = log.sd_card
                 card.status = "available"
                 db.session.commit()
+                _dashboard_counts_cache["expires"] = 0.0
                 flash("SD card returned", "success")
             else:
                 flash("Could not return card", "danger")
 
         return redirect(url_for("sd_cards_view"))
 
-    events = Event.query.order_by(Event.date_start.desc()).all()
-    sessions = Session.query.order_by(Session.date.asc()).all()
+    events = event_options()
+    sessions = session_options()
     sd_cards = SdCard.query.order_by(SdCard.label.asc()).all()
     open_logs = (
-        SdCardLog.query.filter(SdCardLog.returned_at.is_(None))
+        SdCardLog.query.options(
+            joinedload(SdCardLog.sd_card),
+            joinedload(SdCardLog.user),
+            joinedload(SdCardLog.event),
+            joinedload(SdCardLog.session),
+        )
+        .filter(SdCardLog.returned_at.is_(None))
         .order_by(SdCardLog.checked_out_at.desc())
         .all()
     )
@@ -391,20 +613,30 @@ def athletes_view():
 
         return redirect(url_for("athletes_view"))
 
-    events = Event.query.order_by(Event.date_start.desc()).all()
-    sessions = Session.query.order_by(Session.date.asc()).all()
-    packages = Package.query.order_by(Package.name.asc()).all()
+    events = event_options()
+    sessions = session_options()
+    packages = package_options()
 
     selected_event_id = request.args.get("event_id", type=int)
     selected_session_id = request.args.get("session_id", type=int)
 
-    query = AthleteSession.query.join(Athlete).join(Session).join(Event)
+    query = (
+        AthleteSession.query.join(AthleteSession.athlete)
+        .join(AthleteSession.session)
+        .join(AthleteSession.package)
+        .options(
+            contains_eager(AthleteSession.athlete),
+            contains_eager(AthleteSession.session),
+            contains_eager(AthleteSession.package),
+        )
+    )
     if selected_event_id:
-        query = query.filter(Event.id == selected_event_id)
+        query = query.filter(Session.event_id == selected_event_id)
     if selected_session_id:
         query = query.filter(Session.id == selected_session_id)
 
-    athlete_sessions = query.order_by(Session.date.asc(), Athlete.name.asc()).all()
+    # Rows are fetched in batches as the template iterates them
+    athlete_sessions = query.order_by(Session.date.asc(), Athlete.name.asc()).yield_per(200)
 
     return render_template(
         "athletes.html",
@@ -425,11 +657,15 @@ def session_athletes_view():
         flash("Select a session", "warning")
         return redirect(url_for("athletes_view"))
 
-    session_obj = Session.query.get_or_404(session_id)
+    session_obj = db.get_or_404(Session, session_id)
     athlete_sessions = (
-        AthleteSession.query.filter_by(session_id=session_id)
-        .join(Athlete)
-        .join(Package)
+        AthleteSession.query.join(AthleteSession.athlete)
+        .join(AthleteSession.package)
+        .options(
+            contains_eager(AthleteSession.athlete),
+            contains_eager(AthleteSession.package),
+        )
+        .filter(AthleteSession.session_id == session_id)
         .order_by(Athlete.name.asc())
         .all()
     )
@@ -471,11 +707,16 @@ def manpower_view():
 
         return redirect(url_for("manpower_view"))
 
-    events = Event.query.order_by(Event.date_start.desc()).all()
-    sessions = Session.query.order_by(Session.date.asc()).all()
-    users = User.query.filter_by(active=True).order_by(User.name.asc()).all()
+    events = event_options()
+    sessions = session_options()
+    users = active_user_options()
     allocations = (
-        ManpowerAllocation.query.join(Session).join(Event).join(User)
+        ManpowerAllocation.query.join(ManpowerAllocation.session)
+        .options(
+            contains_eager(ManpowerAllocation.session),
+            joinedload(ManpowerAllocation.event),
+            joinedload(ManpowerAllocation.user),
+        )
         .order_by(Session.date.asc(), Session.label.asc())
         .all()
     )
@@ -512,6 +753,7 @@ def edits_view():
                 )
                 db.session.add(task)
                 db.session.commit()
+                _dashboard_counts_cache["expires"] = 0.0
                 flash("Edit task created", "success")
             else:
                 flash("All fields are required", "danger")
@@ -521,7 +763,7 @@ def edits_view():
             status = request.form.get("status", "").strip()
             deliverable_link = request.form.get("deliverable_link", "").strip()
 
-            task = EditTask.query.get(task_id)
+            task = db.session.get(EditTask, task_id)
             if not task:
                 flash("Task not found", "danger")
             else:
@@ -530,22 +772,34 @@ def edits_view():
                 if status:
                     task.status = status
                 task.deliverable_link = deliverable_link or task.deliverable_link
-                task.updated_at = datetime.utcnow()
+                task.updated_at = func.now()
                 db.session.commit()
+                _dashboard_counts_cache["expires"] = 0.0
                 flash("Task updated", "success")
 
         return redirect(url_for("edits_view"))
 
-    events = Event.query.order_by(Event.date_start.desc()).all()
-    sessions = Session.query.order_by(Session.date.asc()).all()
-    users = User.query.filter_by(active=True).order_by(User.name.asc()).all()
+    events = event_options()
+    sessions = session_options()
+    users = active_user_options()
 
     selected_event_id = request.args.get("event_id", type=int)
     selected_session_id = request.args.get("session_id", type=int)
     selected_editor_id = request.args.get("editor_id", type=int)
     selected_status = request.args.get("status", type=str)
 
-    query = EditTask.query.join(AthleteSession).join(Session).join(Event).join(User, EditTask.assigned_to)
+    query = (
+        EditTask.query.options(
+            joinedload(EditTask.assigned_to),
+            joinedload(EditTask.athlete_session).joinedload(AthleteSession.athlete),
+            joinedload(EditTask.athlete_session).joinedload(AthleteSession.session),
+            raiseload("*"),
+        )
+        .join(AthleteSession)
+        .join(Session)
+        .join(Event)
+        .join(User, EditTask.assigned_to)
+    )
 
     if selected_event_id:
         query = query.filter(Event.id == selected_event_id)
@@ -556,8 +810,21 @@ def edits_view():
     if selected_status:
         query = query.filter(EditTask.status == selected_status)
 
-    tasks = query.order_by(EditTask.updated_at.desc()).all()
-    athlete_sessions = AthleteSession.query.join(Session).join(Event).all()
+    # Rows are fetched in batches as the template iterates them
+    tasks = query.order_by(EditTask.updated_at.desc()).yield_per(200)
+    # Only labels are needed for the dropdown, so skip building ORM objects
+    athlete_sessions = db.session.execute(
+        select(
+            AthleteSession.id,
+            Athlete.name.label("athlete_name"),
+            Session.label.label("session_label"),
+            Session.date.label("session_date"),
+            Package.name.label("package_name"),
+        )
+        .join(AthleteSession.athlete)
+        .join(AthleteSession.session)
+        .join(AthleteSession.package)
+    ).all()
 
     return render_template(
         "edits.html",
@@ -632,9 +899,11 @@ def manage_events():
             db.session.commit()
             flash("Session created", "success")
 
+        cache.delete_memoized(event_options)
+        cache.delete_memoized(session_options)
         return redirect(url_for("manage_events"))
 
-    events = Event.query.order_by(Event.date_start.desc()).all()
+    events = Event.query.options(selectinload(Event.sessions)).order_by(Event.date_start.desc()).all()
     # sessions accessible via e.sessions in template
     return render_template("admin_events.html", events=events)
 
@@ -659,6 +928,7 @@ def manage_packages():
             db.session.commit()
             flash("Package created", "success")
 
+        cache.delete_memoized(package_options)
         return redirect(url_for("manage_packages"))
 
     packages = Package.query.order_by(Package.name.asc()).all()
@@ -686,7 +956,7 @@ def manage_users():
             if not (name and email and password):
                 flash("Name, email and password are required", "danger")
             else:
-                existing = User.query.filter_by(email=email).first()
+                existing = User.query.filter(func.lower(User.email) == email).first()
                 if existing:
                     flash("User with that email already exists", "danger")
                 else:
@@ -698,7 +968,7 @@ def manage_users():
 
         elif action == "toggle_active":
             user_id = request.form.get("user_id", type=int)
-            user = User.query.get(user_id)
+            user = db.session.get(User, user_id)
             if user:
                 user.active = not user.active
                 db.session.commit()
@@ -709,7 +979,7 @@ def manage_users():
         elif action == "change_role":
             user_id = request.form.get("user_id", type=int)
             new_role = request.form.get("role", "").strip()
-            user = User.query.get(user_id)
+            user = db.session.get(User, user_id)
             if user and new_role in ["founder", "freelancer"]:
                 user.role = new_role
                 db.session.commit()
@@ -717,6 +987,7 @@ def manage_users():
             else:
                 flash("Could not change role", "danger")
 
+        cache.delete_memoized(active_user_options)
         return redirect(url_for("manage_users"))
 
     users = User.query.order_by(User.name.asc()).all()
@@ -732,6 +1003,33 @@ def init_db_command():
     print("Database initialised.")
 
 
+ARGON2_TARGET_SECONDS = 0.25
+ARGON2_MAX_MEMORY_COST = 256 * 1024  # KiB
+
+
+# Start from OWASP's 46 MiB / 1 pass and double the memory while a hash
+# stays within the time budget, so bigger hosts get stronger hashes
+def tune_argon2_memory_cost():
+    memory_cost = 46 * 1024
+    while memory_cost * 2 <= ARGON2_MAX_MEMORY_COST:
+        start = time.perf_counter()
+        PasswordHasher(time_cost=1, memory_cost=memory_cost, parallelism=1).hash("benchmark")
+        if (time.perf_counter() - start) * 2 > ARGON2_TARGET_SECONDS:
+            break
+        memory_cost *= 2
+    return memory_cost
+
+
+@app.cli.command("tune-argon2")
+def tune_argon2_command():
+    memory_cost = tune_argon2_memory_cost()
+    print(f"ARGON2_MEMORY_COST={memory_cost}")
+    print(
+        f"Each concurrent login hash uses {memory_cost // 1024} MiB; "
+        "budget for gunicorn workers x threads of them."
+    )
+
+
 if __name__ == "__main__":
     with app.app_context():
         db.create_all()
@@ -1,6 +1,8 @@
 from getpass import getpass
 
-from app import app, db, User
+from sqlalchemy import func
+
+from app import app, db, cache, User, active_user_options
 
 if __name__ == "__main__":
     with app.app_context():
@@ -8,7 +10,7 @@ if __name__ == "__main__":
         name = input("Founder name: ").strip()
         password = getpass("Password: ")
 
-        existing = User.query.filter_by(email=email).first()
+        existing = User.query.filter(func.lower(User.email) == email).first()
         if existing:
             print("User with that email already exists.")
         else:
@@ -16,4 +18,5 @@ if __name__ == "__main__":
             user.set_password(password)
             db.session.add(user)
             db.session.commit()
+            cache.delete_memoized(active_user_options)
             print("Founder user created.")
@@ -0,0 +1,7 @@
+import os
+
+# Threaded workers: argon2 releases the GIL while hashing, so a login in one
+# thread no longer blocks the other requests handled by the same worker
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))